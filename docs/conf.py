@@ -5,7 +5,6 @@
 
 import os
 import sys
-from datetime import datetime
 
 sys.path.insert(0, os.path.abspath("../src"))
 
@@ -17,8 +16,9 @@ copyright = "2025, aa-parky"
 author = "aa-parky"
 release = "0.2.0"
 
-# Add build timestamp for peace of mind
-build_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
+# Per-page "Last updated" stamp. Sphinx fills this in per document, so unlike a
+# build-time value injected into html_context it doesn't change the config on
+# every run and invalidate the incremental-build environment
 html_last_updated_fmt = "%Y-%m-%d %H:%M:%S UTC"
 
 # -- General configuration ---------------------------------------------------
@@ -61,11 +61,6 @@ source_suffix = {
 # MyST configuration: treat all Markdown links as external to avoid cross-ref warnings
 myst_all_links_external = True
 
-# Add build date to HTML context for display in footer
-html_context = {
-    'build_date': build_date,
-}
-
 # Add this to conf.py
 intersphinx_mapping = {
     'python': ('https://docs.python.org/3', None),
@@ -24,7 +24,7 @@ class CounterModule(TonikaModule):
 
 
 async def main():
-    bus = TonikaBus()
+    bus = TonikaBus.instance()
     counter = CounterModule("Counter", "1.0.0")
     await counter.init()
 
@@ -32,7 +32,7 @@ async def main():
     bus.emit("counter:increment", {"amount": 3})
     bus.emit("counter:reset", {})
 
-    await asyncio.sleep(0.1)  # Let handlers run
+    await bus.drain()  # Let any async handlers finish
     counter.destroy()
 
 
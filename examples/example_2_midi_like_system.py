@@ -4,7 +4,7 @@
 
 import asyncio
 
-from tonika_bus import TonikaModule
+from tonika_bus import TonikaBus, TonikaModule
 
 
 class MidiInputModule(TonikaModule):
@@ -52,7 +52,7 @@ async def main():
     midi.simulate_key_press(64, 80)  # E
     midi.simulate_key_press(67, 90)  # G
 
-    await asyncio.sleep(0.1)
+    await TonikaBus.instance().drain()
 
     print(f"\nTotal recorded: {len(recorder.recorded)} events")
 
@@ -4,7 +4,7 @@
 
 import asyncio
 
-from tonika_bus import TonikaModule
+from tonika_bus import TonikaBus, TonikaModule
 
 
 class DataProvider(TonikaModule):
@@ -45,8 +45,8 @@ async def main():
     # Request data
     req_id = consumer.request_data("users")
 
-    # Wait briefly to let the response propagate
-    await asyncio.sleep(0.1)
+    # Let the response propagate
+    await TonikaBus.instance().drain()
 
     print(f"Users: {consumer.responses.get(req_id)}")
 
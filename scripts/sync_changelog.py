@@ -9,23 +9,77 @@ Usage:
     python scripts/sync_changelog.py
 
 Requirements:
-    pip install requests
+    None beyond the standard library
 
 Environment Variables:
     GITHUB_TOKEN - GitHub personal access token (optional, but recommended)
+
+The releases response is cached in ~/.cache/tonika_bus together with its
+ETag; repeat runs send If-None-Match and reuse the cached body on a 304.
+It includes unpublished draft releases, so the cache is private to the user.
 """
 
+import json
 import os
 import re
 import sys
+import urllib.error
+import urllib.request
 from pathlib import Path
 
-try:
-    import requests
-except ImportError:
-    print("❌ Error: 'requests' library not installed")
-    print("💡 Install with: pip install requests")
-    sys.exit(1)
+# Conditional-request cache for the GitHub releases listing
+CACHE_DIR = Path.home() / ".cache" / "tonika_bus"
+ETAG_FILE = CACHE_DIR / "changelog_etag"
+RELEASES_FILE = CACHE_DIR / "changelog_releases.json"
+
+
+# Emoji release headings -> Keep a Changelog headings
+EMOJI_HEADINGS = {
+    "### 🎉 Added": "### Added",
+    "### 🔄 Changed": "### Changed",
+    "### 🐛 Fixed": "### Fixed",
+    "### 🗑️ Removed": "### Removed",
+    "### 🔒 Security": "### Security",
+    "### 📚 Documentation": "### Documentation",
+    "### 🧪 Testing": "### Testing",
+    "### ⚙️ Internal": "### Internal",
+}
+
+# Compiled once at import; the emoji headings collapse into a single alternation
+# so the body is scanned once instead of once per heading.
+# Everything from the first tail marker (Goblin Notes, the --- separator before
+# the install instructions, or the Full Changelog link) to EOF is dropped.
+TAIL_RE = re.compile(r'## 🧌 Goblin Notes|---|\*\*Full Changelog\*\*:')
+EMOJI_HEADING_RE = re.compile("|".join(re.escape(heading) for heading in EMOJI_HEADINGS))
+BLANK_LINES_RE = re.compile(r'\n{3,}')
+
+
+def load_cached_releases():
+    """Return (etag, body) from the on-disk cache, or (None, None)"""
+    try:
+        return ETAG_FILE.read_text().strip(), RELEASES_FILE.read_bytes()
+    except OSError:
+        return None, None
+
+
+def write_private(path: Path, data: bytes):
+    """Write a file only the current user can read (0o600)"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    # O_CREAT's mode only applies to new files; tighten older ones too
+    path.chmod(0o600)
+
+
+def save_cached_releases(etag: str, body: bytes):
+    """Store the releases body and its ETag; caching is best-effort"""
+    try:
+        # The body holds token-authenticated draft releases: keep it private
+        CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        write_private(RELEASES_FILE, body)
+        write_private(ETAG_FILE, etag.encode())
+    except OSError:
+        pass
 
 
 def get_latest_draft_release(repo: str, token: str = None):
@@ -36,13 +90,25 @@ def get_latest_draft_release(repo: str, token: str = None):
     if token:
         headers["Authorization"] = f"token {token}"
 
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-    except requests.exceptions.RequestException as e:
-        raise Exception(f"Failed to fetch releases: {e}")
+    # Conditional request: GitHub answers 304 with no body if nothing changed
+    etag, cached_body = load_cached_releases()
+    if etag:
+        headers["If-None-Match"] = etag
 
-    releases = response.json()
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, headers=headers)) as response:
+            body = response.read()
+            new_etag = response.headers.get("ETag")
+        if new_etag:
+            save_cached_releases(new_etag, body)
+    except urllib.error.HTTPError as e:
+        if e.code != 304:
+            raise Exception(f"Failed to fetch releases: {e}") from e
+        body = cached_body
+    except urllib.error.URLError as e:
+        raise Exception(f"Failed to fetch releases: {e}") from e
+
+    releases = json.loads(body)
     drafts = [r for r in releases if r.get("draft", False)]
 
     if not drafts:
@@ -54,35 +120,20 @@ def get_latest_draft_release(repo: str, token: str = None):
 def convert_github_release_to_changelog(release_body: str, version: str, date: str) -> str:
     """Convert GitHub release format to Keep a Changelog format"""
 
-    # Remove the "Full Changelog" link
-    release_body = re.sub(r'\*\*Full Changelog\*\*:.*', '', release_body)
+    # Remove Goblin Notes, installation instructions and the "Full Changelog"
+    # link: cut at the earliest marker in one scan
+    tail = TAIL_RE.search(release_body)
+    if tail:
+        release_body = release_body[:tail.start()]
 
     # Remove "What's Changed" header
     release_body = release_body.replace("## What's Changed", "")
 
-    # Remove Goblin Notes section
-    release_body = re.sub(r'## 🧌 Goblin Notes.*', '', release_body, flags=re.DOTALL)
-
-    # Remove installation instructions
-    release_body = re.sub(r'---.*', '', release_body, flags=re.DOTALL)
-
-    # Convert emoji headings to Keep a Changelog style
-    emoji_map = {
-        "### 🎉 Added": "### Added",
-        "### 🔄 Changed": "### Changed",
-        "### 🐛 Fixed": "### Fixed",
-        "### 🗑️ Removed": "### Removed",
-        "### 🔒 Security": "### Security",
-        "### 📚 Documentation": "### Documentation",
-        "### 🧪 Testing": "### Testing",
-        "### ⚙️ Internal": "### Internal",
-    }
-
-    for emoji_heading, changelog_heading in emoji_map.items():
-        release_body = release_body.replace(emoji_heading, changelog_heading)
+    # Convert emoji headings to Keep a Changelog style (single pass)
+    release_body = EMOJI_HEADING_RE.sub(lambda m: EMOJI_HEADINGS[m.group(0)], release_body)
 
     # Clean up extra whitespace
-    release_body = re.sub(r'\n{3,}', '\n\n', release_body)
+    release_body = BLANK_LINES_RE.sub('\n\n', release_body)
     release_body = release_body.strip()
 
     # Add version header
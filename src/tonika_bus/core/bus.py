@@ -14,8 +14,10 @@ Part of the Tonika project - Music as Resistance
 
 import asyncio
 import logging
+import sys
 from collections import deque
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Iterable
+from itertools import islice
 from typing import TYPE_CHECKING, Any, Optional, cast
 
 # Import from package (MyPy-friendly)
@@ -29,6 +31,39 @@ if TYPE_CHECKING:
 EventHandler = Callable[[TonikaEvent], None] | Callable[[TonikaEvent], Coroutine[Any, Any, None]]
 
 
+def _intern_type(event_type: str) -> str:
+    """Intern an event type; str subclasses (e.g. StrEnum) can't be, so pass them through."""
+    return sys.intern(event_type) if type(event_type) is str else event_type
+
+
+class _Unsubscribe:
+    """
+    Callable returned by TonikaBus.on() / once() - call it to stop listening.
+
+    A slotted object instead of a closure: no function object or cells
+    are allocated per subscription. For once() it is also the registration
+    itself: the once registry stores these objects, so an unsubscribe only
+    ever removes its own registration, never an equal handler's.
+    """
+
+    __slots__ = ("_bus", "_event_type", "_handler", "_once")
+
+    def __init__(
+        self, bus: "TonikaBus", event_type: str, handler: EventHandler, once: bool = False
+    ) -> None:
+        self._bus = bus
+        self._event_type = event_type
+        self._handler = handler
+        self._once = once
+
+    def __call__(self) -> None:
+        bus = self._bus
+        if self._once:
+            bus._remove_once_handler(self._event_type, self)
+        else:
+            bus._remove_handler(self._event_type, self._handler)
+
+
 class TonikaBus:
     """
     The Central Bus - Singleton pattern
@@ -44,9 +79,31 @@ class TonikaBus:
     preventing direct coupling between modules.
     """
 
+    # Fixed attribute layout: emit() touches several of these on every call,
+    # and slot reads skip the instance __dict__ lookup
+    __slots__ = (
+        "handlers",
+        "_coro_flags",
+        "_once_handlers",
+        "module_registry",
+        "_event_log_maxlen",
+        "event_log",
+        "_logging_enabled",
+        "_log_unhandled",
+        "debug",
+        "logger",
+        "_wait_promises",
+        "_tasks",
+        "_draining",
+    )
+
+    # Singleton bookkeeping lives on the class, not in the slots
     _instance: Optional["TonikaBus"] = None
     _initialized: bool = False
 
+    # Default event log capacity (see set_event_log_cap())
+    DEFAULT_EVENT_LOG_CAP: int = 1000
+
     def __new__(cls) -> "TonikaBus":
         """
         Singleton pattern - only one Bus exists.
@@ -69,8 +126,19 @@ class TonikaBus:
         - Wait promises (for async event waiting)
         """
         if not TonikaBus._initialized:
-            # Event handlers: event_type -> set of handler functions
-            self.handlers: dict[str, set[EventHandler]] = {}
+            # Event handlers: event_type -> handler functions in registration order.
+            # Copy-on-write tuples: (un)subscribing swaps in a new tuple, so emit()
+            # iterates the current one directly - no per-emit copy, and changes
+            # made by a handler mid-dispatch can't disturb the loop in progress
+            self.handlers: dict[str, tuple[EventHandler, ...]] = {}
+
+            # Which of those handlers are coroutine functions, worked out once per
+            # handler tuple: event_type -> (the tuple it describes, one flag each)
+            self._coro_flags: dict[str, tuple[tuple[EventHandler, ...], tuple[bool, ...]]] = {}
+
+            # One-shot registrations: event_type -> the _Unsubscribe tokens once()
+            # returned (each holds its handler), popped as a whole on emit
+            self._once_handlers: dict[str, list[_Unsubscribe]] = {}
 
             # Module registry: module_name -> module instance
             # Goblin Law #13: Keep the Guest List Clean
@@ -78,8 +146,11 @@ class TonikaBus:
 
             # Event log: bounded deque to prevent unbounded memory growth
             # Goblin Law #7: No Fat Orcs - keep it lean
-            self._event_log_maxlen: int = 1000
+            self._event_log_maxlen: int = self.DEFAULT_EVENT_LOG_CAP
             self.event_log: deque[TonikaEvent] = deque(maxlen=self._event_log_maxlen)
+            self._logging_enabled: bool = True
+            # Also log events nobody listens for (implies _logging_enabled)
+            self._log_unhandled: bool = True
 
             # Debug mode and logging
             self.debug: bool = False
@@ -88,9 +159,61 @@ class TonikaBus:
             # Wait promises for async event waiting
             self._wait_promises: dict[str, list[asyncio.Future[TonikaEvent]]] = {}
 
+            # Tasks running async handlers; holding them keeps the loop from
+            # garbage-collecting a pending handler and lets drain() await them
+            self._tasks: set[asyncio.Task[None]] = set()
+
+            # Handler tasks currently blocked in drain(); other drains skip them
+            self._draining: set[asyncio.Task[Any]] = set()
+
             TonikaBus._initialized = True
             self.logger.info("🚌 Tonika Bus initialized - Goblin Law #37 enforcement active")
 
+    @classmethod
+    def instance(cls) -> "TonikaBus":
+        """
+        Get the Bus singleton without re-running the constructor guards.
+
+        TonikaBus() works too, but every call goes through __new__ and
+        __init__; this returns the cached instance directly once it exists.
+
+        Returns:
+            The one and only TonikaBus
+        """
+        bus = cls._instance
+        if bus is None:
+            bus = cls()
+        return bus
+
+    def reset_state(self) -> None:
+        """
+        Return the Bus to its freshly-initialized state, in place.
+
+        Drops all subscriptions, registered modules, logged events and pending
+        waiters, cancels still-running handler tasks, and switches debug off
+        (logger level included) and the event log back on. The singleton and
+        its containers are reused, so existing references to the Bus stay
+        valid. Meant for test fixtures and hot reloads; pending wait_for()
+        futures are abandoned, not resolved.
+        """
+        self.handlers.clear()
+        self._coro_flags.clear()
+        self._once_handlers.clear()
+        self.module_registry.clear()
+        if self._event_log_maxlen != self.DEFAULT_EVENT_LOG_CAP:
+            self.set_event_log_cap(self.DEFAULT_EVENT_LOG_CAP)
+        self.event_log.clear()
+        self._logging_enabled = True
+        self._log_unhandled = True
+        self.set_debug(False)
+        self._wait_promises.clear()
+        # Cancel rather than forget: an orphaned handler would keep running
+        # against the reset Bus with nothing left to await it
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+        self._draining.clear()
+
     def set_debug(self, enabled: bool) -> None:
         """
         Enable or disable debug logging.
@@ -102,6 +225,27 @@ class TonikaBus:
         level = logging.DEBUG if enabled else logging.INFO
         self.logger.setLevel(level)
 
+    def set_logging(self, enabled: bool, *, unhandled: bool = True) -> None:
+        """
+        Enable or disable the event log.
+
+        The log is a debugging aid; high-throughput deployments can turn it
+        off to drop the per-emit append and let events be freed as soon as
+        their handlers return. Events nobody listens for are then not even
+        constructed. While disabled, get_event_log() only returns events
+        recorded before logging was switched off.
+
+        With unhandled=False the log keeps recording events that have a
+        listener, but events nobody listens for are skipped (and, with debug
+        off, never constructed) - useful against floods of unheard events.
+
+        Args:
+            enabled: True to record emitted events, False to skip recording
+            unhandled: Whether to also record events that have no listener
+        """
+        self._logging_enabled = enabled
+        self._log_unhandled = enabled and unhandled
+
     def emit(
         self, event_type: str, detail: Any, source: str = "unknown", version: str = "0.0.0"
     ) -> None:
@@ -125,42 +269,196 @@ class TonikaBus:
             source: Which module emitted it
             version: Module version for debugging
         """
-        # Create event with metadata
-        event = TonikaEvent(
-            type=event_type, detail=detail, _meta=EventMetadata.create(source, version)
-        )
+        # Who will see this event?
+        handlers = self.handlers.get(event_type)
+        once_handlers = self._once_handlers.get(event_type)
+        waiters = self._wait_promises.get(event_type)
+        listening = handlers or once_handlers or waiters
+
+        # Zero-allocation path: no listener, no log, no debug output means
+        # nothing could ever observe the event, so don't even build it
+        if not listening and not self._log_unhandled and not self.debug:
+            return
+
+        # Create event with metadata (positional: cheaper than keyword args).
+        # The type is interned so logged events of one type share one string;
+        # ':' keeps the compiler from interning event-type literals itself
+        event = TonikaEvent(_intern_type(event_type), detail, EventMetadata.create(source, version))
+
+        # One-shot registrations are claimed only once the event exists, so a
+        # failure building it cannot lose them
+        if once_handlers:
+            del self._once_handlers[event_type]
+        if waiters:
+            del self._wait_promises[event_type]
 
-        # Add to event log for debugging
-        self.event_log.append(event)
+        # Add to event log for debugging (skipped entirely when logging is off)
+        if self._log_unhandled or (listening and self._logging_enabled):
+            self.event_log.append(event)
 
         # Debug logging if enabled
         if self.debug:
-            self.logger.debug(f"📢 EMIT: {event}")
+            self.logger.debug("📢 EMIT: %s", event)
+
+        # Fast path: nobody is listening, so there is nothing left to do
+        # Goblin Law #7: No Fat Orcs - unheard events only cost the log entry
+        if not listening:
+            return
 
         # Notify all handlers for this event type
-        # Note: Convert to list to avoid "Set changed size during iteration"
-        # if a handler unsubscribes during execution
-        if event_type in self.handlers:
-            for handler in list(self.handlers[event_type]):
-                try:
-                    if asyncio.iscoroutinefunction(handler):
-                        try:
-                            loop = asyncio.get_running_loop()
-                            loop.create_task(handler(event))
-                        except RuntimeError:
-                            # No running loop; run synchronously to ensure execution
-                            asyncio.run(handler(event))
-                    else:
-                        handler(event)
-                except Exception as e:
-                    self.logger.error(f"❌ Handler error for {event_type}: {e}", exc_info=True)
+        # Note: `handlers` is an immutable snapshot; subscription changes made by
+        # handlers take effect from the next emit (including re-entrant ones)
+        if handlers:
+            self._call_handlers(handlers, event, None, self._coroutine_flags(event_type, handlers))
+
+        # One-shot handlers were popped above, so they are already unsubscribed
+        # and a re-entrant emit of the same type cannot fire them again
+        if once_handlers:
+            self._call_handlers([reg._handler for reg in once_handlers], event)
 
         # Resolve any wait_for promises
-        if event_type in self._wait_promises:
-            for future in self._wait_promises[event_type]:
+        # Note: set_result() only marks the future done; awaiting coroutines are
+        # woken via loop.call_soon(), so they resume after emit() has returned
+        if waiters:
+            for future in waiters:
                 if not future.done():
                     future.set_result(event)
-            del self._wait_promises[event_type]
+
+    async def emit_async(
+        self, event_type: str, detail: Any, source: str = "unknown", version: str = "0.0.0"
+    ) -> None:
+        """
+        Emit an event and wait for its async handlers to finish.
+
+        Like emit(), but async handlers (persistent and one-shot) are run
+        concurrently with asyncio.gather() and awaited, instead of being
+        scheduled fire-and-forget. Sync handlers still run inline, before
+        any async handler starts. Handler exceptions are logged, not raised.
+
+        Args:
+            event_type: Event type (e.g., "midi:note-on", "module:ready")
+            detail: The actual payload data
+            source: Which module emitted it
+            version: Module version for debugging
+        """
+        handlers = self.handlers.get(event_type)
+        event = TonikaEvent(_intern_type(event_type), detail, EventMetadata.create(source, version))
+        once_handlers = self._once_handlers.pop(event_type, None)
+        waiters = self._wait_promises.pop(event_type, None)
+
+        if self._log_unhandled or (
+            self._logging_enabled and (handlers or once_handlers or waiters)
+        ):
+            self.event_log.append(event)
+
+        if self.debug:
+            self.logger.debug("📢 EMIT ASYNC: %s", event)
+
+        coros: list[Coroutine[Any, Any, None]] = []
+        if handlers:
+            self._call_handlers(handlers, event, coros, self._coroutine_flags(event_type, handlers))
+        if once_handlers:
+            self._call_handlers([reg._handler for reg in once_handlers], event, coros)
+
+        if waiters:
+            for future in waiters:
+                if not future.done():
+                    future.set_result(event)
+
+        if coros:
+            for result in await asyncio.gather(*coros, return_exceptions=True):
+                if isinstance(result, Exception):
+                    self.logger.error(
+                        "❌ Handler error for %s: %s", event_type, result, exc_info=result
+                    )
+
+    def emit_batch(
+        self,
+        items: Iterable[tuple[str, Any]],
+        source: str = "unknown",
+        version: str = "0.0.0",
+    ) -> None:
+        """
+        Emit several events from one source in a single call.
+
+        Cheaper than calling emit() in a loop for bursts: all events are
+        logged with one extend(), and each event type's once handlers and
+        waiters are looked up once for the whole batch.
+
+        Notes:
+            - Events are created and logged in input order. They share one
+              timestamp, and their _meta.seq values follow input order.
+            - Dispatch is grouped by event type, in order of first appearance:
+              every event of the first type is dispatched before any event of
+              the next type.
+            - once() handlers and wait_for() waiters receive the first event
+              of their type in the batch.
+
+        Args:
+            items: (event_type, detail) pairs
+            source: Which module emitted them
+            version: Module version for debugging
+        """
+        items = list(items)
+        if not items:
+            return
+
+        # Zero-allocation path, as in emit(): with no listener for any item and
+        # nothing logging or printing them, no event in the batch is observable
+        if (
+            not self._log_unhandled
+            and not self.debug
+            and not any(
+                t in self.handlers or t in self._once_handlers or t in self._wait_promises
+                for t, _ in items
+            )
+        ):
+            return
+
+        # One clock read for the whole burst; seq still orders the events
+        metas = EventMetadata.create_many(source, version, len(items))
+        events = [
+            TonikaEvent(_intern_type(t), d, meta) for (t, d), meta in zip(items, metas, strict=True)
+        ]
+
+        if self._log_unhandled:
+            self.event_log.extend(events)
+        elif self._logging_enabled:
+            self.event_log.extend(
+                event
+                for event in events
+                if self.handlers.get(event.type)
+                or event.type in self._once_handlers
+                or event.type in self._wait_promises
+            )
+
+        if self.debug:
+            for event in events:
+                self.logger.debug("📢 EMIT: %s", event)
+
+        groups: dict[str, list[TonikaEvent]] = {}
+        for event in events:
+            groups.setdefault(event.type, []).append(event)
+
+        for event_type, group in groups.items():
+            once_handlers = self._once_handlers.pop(event_type, None)
+            waiters = self._wait_promises.pop(event_type, None)
+
+            # Re-read the snapshot per event so subscription changes made by a
+            # handler apply to the rest of the batch, as with emit() in a loop
+            for event in group:
+                handlers = self.handlers.get(event_type)
+                if handlers:
+                    flags = self._coroutine_flags(event_type, handlers)
+                    self._call_handlers(handlers, event, None, flags)
+
+            if once_handlers:
+                self._call_handlers([reg._handler for reg in once_handlers], group[0])
+
+            if waiters:
+                for future in waiters:
+                    if not future.done():
+                        future.set_result(group[0])
 
     def on(self, event_type: str, handler: EventHandler) -> Callable[[], None]:
         """
@@ -178,23 +476,10 @@ class TonikaBus:
         Returns:
             Unsubscribe function (call it to stop listening)
         """
-        if event_type not in self.handlers:
-            self.handlers[event_type] = set()
-
-        self.handlers[event_type].add(handler)
-
-        if self.debug:
-            handler_count = len(self.handlers[event_type])
-            self.logger.debug(f"👂 SUBSCRIBE: {event_type} (total handlers: {handler_count})")
+        self._add_handler(event_type, handler)
 
         # Return unsubscribe function
-        def unsubscribe() -> None:
-            if event_type in self.handlers and handler in self.handlers[event_type]:
-                self.handlers[event_type].remove(handler)
-                if self.debug:
-                    self.logger.debug(f"🔇 UNSUBSCRIBE: {event_type}")
-
-        return unsubscribe
+        return _Unsubscribe(self, event_type, handler)
 
     def once(self, event_type: str, handler: EventHandler) -> Callable[[], None]:
         """
@@ -202,6 +487,7 @@ class TonikaBus:
 
         Automatically unsubscribes after the first event.
         Supports both sync and async handlers; async handlers are scheduled.
+        One-shot handlers run after the persistent (on()) handlers for the event.
 
         Args:
             event_type: The event type to listen for
@@ -210,24 +496,155 @@ class TonikaBus:
         Returns:
             Unsubscribe function (in case you want to cancel early)
         """
-        unsub = None
+        # Stored in a separate registry that emit() pops wholesale - no wrapper
+        # closure, no extra call frame per dispatch, no unsubscribe round-trip.
+        # The unsubscribe token doubles as the registration, so cancelling it
+        # cannot touch another once() of the same handler
+        registration = _Unsubscribe(self, event_type, handler, once=True)
+        registrations = self._once_handlers.setdefault(event_type, [])
+        registrations.append(registration)
+
+        if self.debug:
+            self.logger.debug(
+                "👂 SUBSCRIBE ONCE: %s (total handlers: %d)", event_type, len(registrations)
+            )
+
+        return registration
 
-        def one_time_handler(event: TonikaEvent) -> None:
+    def unsubscribe_many(self, unsubs: Iterable[Callable[[], None]]) -> None:
+        """
+        Cancel several subscriptions at once.
+
+        Equivalent to calling each unsubscribe function, but each affected
+        handler tuple is rebuilt once instead of once per subscription.
+        Used by TonikaModule.destroy().
+
+        Args:
+            unsubs: Unsubscribe functions returned by on() / once()
+        """
+        removals: dict[str, set[EventHandler]] = {}
+        once_removals: dict[str, set[_Unsubscribe]] = {}
+        for unsub in unsubs:
+            if not isinstance(unsub, _Unsubscribe) or unsub._bus is not self:
+                unsub()
+                continue
+            if unsub._once:
+                # Once registrations are removed by token, not by handler
+                once_removals.setdefault(unsub._event_type, set()).add(unsub)
+            else:
+                removals.setdefault(unsub._event_type, set()).add(unsub._handler)
+
+        for event_type, doomed_regs in once_removals.items():
+            once_list = self._once_handlers.get(event_type)
+            if once_list:
+                once_list[:] = [reg for reg in once_list if reg not in doomed_regs]
+                if not once_list:
+                    del self._once_handlers[event_type]
+
+        for event_type, doomed in removals.items():
+            current = self.handlers.get(event_type)
+            if current:
+                new_handlers = tuple(h for h in current if h not in doomed)
+                self._set_handlers(event_type, new_handlers)
+
+        if self.debug and (removals or once_removals):
+            self.logger.debug("🔇 UNSUBSCRIBE MANY: %s", ", ".join({*removals, *once_removals}))
+
+    def _coroutine_flags(
+        self, event_type: str, handlers: tuple[EventHandler, ...]
+    ) -> tuple[bool, ...]:
+        """
+        Return which of an event type's handlers are coroutine functions.
+
+        asyncio.iscoroutinefunction() is by far the most expensive step of
+        dispatching a sync handler, so it runs once per handler tuple - on
+        (un)subscribe - instead of once per handler per emit. The cache entry
+        is keyed on the tuple's identity, so a stale entry is never used.
+        """
+        cached = self._coro_flags.get(event_type)
+        if cached is not None and cached[0] is handlers:
+            return cached[1]
+        flags = tuple(map(asyncio.iscoroutinefunction, handlers))
+        self._coro_flags[event_type] = (handlers, flags)
+        return flags
+
+    def _call_handlers(
+        self,
+        handlers: Iterable[EventHandler],
+        event: TonikaEvent,
+        coros: list[Coroutine[Any, Any, None]] | None = None,
+        flags: Iterable[bool] | None = None,
+    ) -> None:
+        """
+        Invoke handlers for an event, isolating failures.
+
+        Sync handlers run inline. Async handlers are scheduled with
+        create_task() when a loop is running, otherwise run via asyncio.run().
+        If `coros` is given (emit_async), async handlers' coroutines are
+        collected there for the caller to await instead. `flags` marks which
+        handlers are coroutine functions; it is worked out here if omitted.
+        """
+        if flags is None:
+            flags = map(asyncio.iscoroutinefunction, handlers)
+        for handler, is_coro in zip(handlers, flags, strict=True):
             try:
-                if asyncio.iscoroutinefunction(handler):
+                if is_coro:
+                    # The precomputed flag doesn't narrow the handler's type
+                    coro = cast(Coroutine[Any, Any, None], handler(event))
+                    if coros is not None:
+                        coros.append(coro)
+                        continue
                     try:
                         loop = asyncio.get_running_loop()
-                        loop.create_task(handler(event))
+                        task = loop.create_task(coro)
+                        self._tasks.add(task)
+                        task.add_done_callback(self._tasks.discard)
                     except RuntimeError:
-                        asyncio.run(handler(event))
+                        # No running loop; run synchronously to ensure execution
+                        asyncio.run(coro)
                 else:
                     handler(event)
-            finally:
-                if unsub:
-                    unsub()
+            except Exception as e:
+                self.logger.error("❌ Handler error for %s: %s", event.type, e, exc_info=True)
+
+    def _add_handler(self, event_type: str, handler: EventHandler) -> None:
+        """Append a handler to the registry (no-op if already subscribed)."""
+        handlers = self.handlers.get(event_type, ())
+        if handler not in handlers:
+            handlers = self.handlers[event_type] = (*handlers, handler)
+            self._coroutine_flags(event_type, handlers)
 
-        unsub = self.on(event_type, one_time_handler)
-        return unsub
+        if self.debug:
+            self.logger.debug("👂 SUBSCRIBE: %s (total handlers: %d)", event_type, len(handlers))
+
+    def _remove_handler(self, event_type: str, handler: EventHandler) -> None:
+        """Remove a handler from the registry (no-op if not subscribed)."""
+        handlers = self.handlers.get(event_type)
+        if handlers and handler in handlers:
+            self._set_handlers(event_type, tuple(h for h in handlers if h != handler))
+            if self.debug:
+                self.logger.debug("🔇 UNSUBSCRIBE: %s", event_type)
+
+    def _set_handlers(self, event_type: str, handlers: tuple[EventHandler, ...]) -> None:
+        """Install a new handler tuple, pruning the entry once nobody is left."""
+        if handlers:
+            self.handlers[event_type] = handlers
+            self._coroutine_flags(event_type, handlers)
+        else:
+            # Empty entries would pile up for every type ever subscribed and
+            # make `event_type in bus.handlers` claim listeners that are gone
+            del self.handlers[event_type]
+            self._coro_flags.pop(event_type, None)
+
+    def _remove_once_handler(self, event_type: str, registration: _Unsubscribe) -> None:
+        """Cancel a once() registration that has not fired yet (no-op otherwise)."""
+        handlers = self._once_handlers.get(event_type)
+        if handlers and registration in handlers:
+            handlers.remove(registration)
+            if not handlers:
+                del self._once_handlers[event_type]
+            if self.debug:
+                self.logger.debug("🔇 UNSUBSCRIBE ONCE: %s", event_type)
 
     async def wait_for(self, event_type: str, timeout_ms: int | None = None) -> TonikaEvent:
         """
@@ -249,19 +666,70 @@ class TonikaBus:
         Raises:
             asyncio.TimeoutError: If timeout is reached
         """
-        future = cast(asyncio.Future[TonikaEvent], asyncio.get_event_loop().create_future())
-
-        if event_type not in self._wait_promises:
-            self._wait_promises[event_type] = []
-
-        self._wait_promises[event_type].append(future)
+        future = cast(asyncio.Future[TonikaEvent], asyncio.get_running_loop().create_future())
+        self._wait_promises.setdefault(event_type, []).append(future)
+
+        try:
+            if timeout_ms:
+                # asyncio.timeout() cancels the current task in place; unlike
+                # asyncio.wait_for() it does not wrap the future in another task
+                async with asyncio.timeout(timeout_ms / 1000.0):
+                    return await future
+            return await future
+        except BaseException:
+            # Timed out or cancelled: drop the dead future so an event that
+            # never arrives does not keep waiters piling up under its type
+            self._drop_waiter(event_type, future)
+            raise
+
+    def _drop_waiter(self, event_type: str, future: asyncio.Future[TonikaEvent]) -> None:
+        """Remove an abandoned wait_for() future (no-op if emit already took it)."""
+        waiters = self._wait_promises.get(event_type)
+        if waiters and future in waiters:
+            waiters.remove(future)
+            if not waiters:
+                del self._wait_promises[event_type]
+
+    async def drain(self) -> None:
+        """
+        Wait until every scheduled async handler has finished.
 
-        if timeout_ms:
-            timeout_seconds = timeout_ms / 1000.0
-            return await asyncio.wait_for(future, timeout=timeout_seconds)
-        return await future
+        Sync handlers have already run by the time emit() returns; async
+        handlers are scheduled as tasks. drain() awaits those tasks, including
+        any scheduled by events they emit, and returns at once when none are
+        pending. Use it instead of sleeping to "let handlers run".
 
-    def get_event_log(self, limit: int | None = None) -> list[TonikaEvent]:
+        Example:
+            bus.emit("counter:increment", {"amount": 5})
+            await bus.drain()
+            # Every handler for the event has now completed
+
+        Handler exceptions are not raised here; they surface through the
+        usual asyncio task exception reporting.
+
+        Called from inside an async handler, drain() skips that handler's
+        own task, and those of any other handlers blocked in drain() - none
+        of them can finish until their drain() returns - and waits for the
+        rest. Callers outside the handlers still wait for all of them.
+        Async handlers emitted with no running loop are not tracked: they
+        run to completion via asyncio.run() before emit() returns.
+        """
+        current = asyncio.current_task()
+        if current not in self._tasks:
+            while self._tasks:
+                await asyncio.wait(tuple(self._tasks))
+            return
+
+        self._draining.add(current)
+        try:
+            while pending := self._tasks - self._draining:
+                await asyncio.wait(pending)
+        finally:
+            self._draining.discard(current)
+
+    def get_event_log(
+        self, limit: int | None = None, event_type: str | None = None
+    ) -> list[TonikaEvent]:
         """
         Get recent events from the log.
 
@@ -269,16 +737,45 @@ class TonikaBus:
 
         Args:
             limit: Maximum number of events to return (None = all)
+            event_type: Only return events of this type (None = all types)
 
         Returns:
-            List of recent events
+            List of recent events, oldest first
         """
+        if event_type is not None:
+            # Scan from the newest entry and stop once `limit` matches are found.
+            # No per-type index: it would double the per-emit logging cost
+            matches = (event for event in reversed(self.event_log) if event.type == event_type)
+            recent = list(islice(matches, limit) if limit else matches)
+            recent.reverse()
+            return recent
         if limit:
-            # deque doesn't support slicing; convert to list first
-            return list(self.event_log)[-limit:]
+            # Walk back from the newest entry so only `limit` events are touched,
+            # instead of materializing the whole deque and slicing its tail
+            recent = list(islice(reversed(self.event_log), limit))
+            recent.reverse()
+            return recent
         # Return a copy as list to avoid exposing internal deque
         return list(self.event_log)
 
+    def set_event_log_cap(self, cap: int) -> None:
+        """
+        Change how many events the log keeps.
+
+        The log is a bounded deque: once full, each new event evicts the
+        oldest one. Shrinking keeps the most recent `cap` events.
+
+        Args:
+            cap: Maximum number of events to retain (must be positive)
+
+        Raises:
+            ValueError: If cap is not positive
+        """
+        if cap <= 0:
+            raise ValueError(f"Event log cap must be positive, got {cap}")
+        self._event_log_maxlen = cap
+        self.event_log = deque(self.event_log, maxlen=cap)
+
     def clear_event_log(self) -> None:
         """
         Clear the event log.
@@ -300,7 +797,7 @@ class TonikaBus:
             module: The module to register
         """
         self.module_registry[module.name] = module
-        self.logger.info(f"📝 Module registered: {module.name} v{module.version}")
+        self.logger.info("📝 Module registered: %s v%s", module.name, module.version)
 
     def unregister_module(self, module_name: str) -> None:
         """
@@ -311,7 +808,7 @@ class TonikaBus:
         """
         if module_name in self.module_registry:
             del self.module_registry[module_name]
-            self.logger.info(f"🗑️  Module unregistered: {module_name}")
+            self.logger.info("🗑️  Module unregistered: %s", module_name)
 
     def get_module(self, module_name: str) -> Any | None:
         """
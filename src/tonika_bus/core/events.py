@@ -10,11 +10,16 @@ License: GPL-3.0
 Part of the Tonika project - Music as Resistance
 """
 
+import itertools
+import time
 from dataclasses import dataclass
-from datetime import datetime
 from enum import Enum
 from typing import Any
 
+# Process-wide emission counter - next() on itertools.count is a single C call
+# and atomic under the GIL, so sequence numbers are unique and strictly increasing
+_next_seq = itertools.count(1).__next__
+
 
 class ModuleStatus(Enum):
     """
@@ -31,7 +36,7 @@ class ModuleStatus(Enum):
     DESTROYED = "destroyed"
 
 
-@dataclass
+@dataclass(slots=True)
 class EventMetadata:
     """
     Metadata for every Tonika event - who, when, what version.
@@ -39,15 +44,20 @@ class EventMetadata:
     Every message carries context to enable time-travel debugging
     and provide audit trail for complex interactions.
 
+    Wall-clock timestamps are for display only - they can jump backwards under
+    NTP adjustment. Use `seq` when the relative order of events matters.
+
     Attributes:
         timestamp: Unix epoch milliseconds (when event occurred)
         source: Module name that emitted the event
         version: Module version for debugging compatibility issues
+        seq: Monotonic emission sequence number (0 if built by hand)
     """
 
     timestamp: int  # Unix epoch milliseconds
     source: str  # Which module emitted it
     version: str  # Module version for debugging
+    seq: int = 0  # Monotonic ordering key, assigned by create()
 
     @staticmethod
     def create(source: str, version: str) -> "EventMetadata":
@@ -59,14 +69,33 @@ class EventMetadata:
             version: Version string of the emitting module
 
         Returns:
-            EventMetadata with current timestamp
+            EventMetadata with current timestamp and the next sequence number
         """
-        return EventMetadata(
-            timestamp=int(datetime.now().timestamp() * 1000), source=source, version=version
-        )
+        # time_ns() is a single C call returning an int - no datetime/float round-trip.
+        # Positional args: keyword calls into a dataclass __init__ cost noticeably more
+        return EventMetadata(time.time_ns() // 1_000_000, source, version, _next_seq())
+
+    @staticmethod
+    def create_many(source: str, version: str, count: int) -> list["EventMetadata"]:
+        """
+        Factory method for a burst of events from one source.
+
+        Reads the clock once and stamps every entry with that timestamp;
+        each entry still gets its own sequence number, so their order is kept.
+
+        Args:
+            source: Name of the module emitting the events
+            version: Version string of the emitting module
+            count: Number of metadata records to create
+
+        Returns:
+            List of `count` EventMetadata sharing one timestamp, in seq order
+        """
+        timestamp = time.time_ns() // 1_000_000
+        return [EventMetadata(timestamp, source, version, _next_seq()) for _ in range(count)]
 
 
-@dataclass
+@dataclass(slots=True)
 class TonikaEvent:
     """
     Core event structure for all Bus communication.
@@ -13,13 +13,25 @@ Part of the Tonika project - Music as Resistance
 """
 
 import logging
-from collections.abc import Callable
+import sys
+from collections.abc import Callable, Iterable
 from typing import Any
 
 # Import from package (MyPy-friendly)
 from tonika_bus.core.bus import EventHandler, TonikaBus
 from tonika_bus.core.events import ModuleStatus, TonikaEvent
 
+# Enum .value goes through a descriptor on every access; lifecycle payloads
+# and get_status() read the plain string from this table instead
+_STATUS_VALUE: dict[ModuleStatus, str] = {status: status.value for status in ModuleStatus}
+
+# Lifecycle event types, interned so handler-table lookups for them can
+# match on identity (the ':' keeps the compiler from interning the literals)
+_EV_INITIALIZING = sys.intern("module:initializing")
+_EV_READY = sys.intern("module:ready")
+_EV_ERROR = sys.intern("module:error")
+_EV_DESTROYED = sys.intern("module:destroyed")
+
 
 class TonikaModule:
     """
@@ -40,6 +52,14 @@ class TonikaModule:
     Modules communicate through the Bus, never directly.
     """
 
+    # Fixed base-class layout: the lifecycle state lives in slots, not a
+    # per-instance __dict__. Subclasses that don't declare __slots__ still
+    # get a __dict__, so they can set attributes freely in _initialize()
+    __slots__ = ("name", "version", "description", "status", "_unsubs", "_bus", "logger")
+
+    # Shared by every module; instances log through a LoggerAdapter
+    _logger = logging.getLogger("TonikaModule")
+
     def __init__(self, name: str, version: str = "0.0.0", description: str = ""):
         """
         Initialize a Tonika module.
@@ -49,8 +69,11 @@ class TonikaModule:
             version: Module version (for debugging)
             description: Brief description of module purpose
         """
-        self.name = name
-        self.version = version
+        # Interned: these strings are stamped on every event the module emits
+        # and used as registry keys, so equal names share one object.
+        # sys.intern() rejects str subclasses (e.g. StrEnum), so those are kept as-is
+        self.name = sys.intern(name) if type(name) is str else name
+        self.version = sys.intern(version) if type(version) is str else version
         self.description = description
         self.status = ModuleStatus.UNINITIALIZED
 
@@ -59,15 +82,18 @@ class TonikaModule:
         self._unsubs: list[Callable[[], None]] = []
 
         # Access to the Bus (singleton)
-        self._bus = TonikaBus()
+        self._bus = TonikaBus.instance()
 
-        # Module-specific logger
-        self.logger = logging.getLogger(f"TonikaModule.{name}")
+        # Module-specific logger: an adapter over the shared class logger, so
+        # creating a module neither walks the logger hierarchy nor leaves a
+        # per-name Logger behind in the logging manager after destroy().
+        # The module name is available to formatters as %(tonika_module)s.
+        self.logger = logging.LoggerAdapter(TonikaModule._logger, {"tonika_module": name})
 
         # Register with Bus
         # Goblin Law #13: Keep the Guest List Clean
         self._bus.register_module(self)
-        self.logger.info(f"🧩 Module created: {name} v{version}")
+        self.logger.info("🧩 Module created: %s v%s", name, version)
 
     async def init(self) -> None:
         """
@@ -84,8 +110,8 @@ class TonikaModule:
         try:
             self.status = ModuleStatus.INITIALIZING
             self.emit(
-                "module:initializing",
-                {"name": self.name, "version": self.version, "status": self.status.value},
+                _EV_INITIALIZING,
+                {"name": self.name, "version": self.version, "status": _STATUS_VALUE[self.status]},
             )
 
             # Call custom initialization
@@ -94,24 +120,31 @@ class TonikaModule:
 
             self.status = ModuleStatus.READY
             self.emit(
-                "module:ready",
-                {"name": self.name, "version": self.version, "status": self.status.value},
+                _EV_READY,
+                {"name": self.name, "version": self.version, "status": _STATUS_VALUE[self.status]},
             )
 
-            self.logger.info(f"✅ Module ready: {self.name}")
+            self.logger.info("✅ Module ready: %s", self.name)
 
         except Exception as e:
             self.status = ModuleStatus.ERROR
             self.emit(
-                "module:error",
+                _EV_ERROR,
                 {
                     "name": self.name,
                     "version": self.version,
-                    "status": self.status.value,
+                    "status": _STATUS_VALUE[self.status],
                     "error": str(e),
                 },
             )
-            self.logger.error(f"❌ Module init failed: {self.name} - {e}", exc_info=True)
+            # The exception is re-raised to the caller, so only attach the
+            # traceback to the log record when debug output is wanted
+            self.logger.error(
+                "❌ Module init failed: %s - %s",
+                self.name,
+                e,
+                exc_info=self.logger.isEnabledFor(logging.DEBUG),
+            )
             raise
 
     async def _initialize(self) -> None:
@@ -144,6 +177,31 @@ class TonikaModule:
         """
         self._bus.emit(event_type, detail, source=self.name, version=self.version)
 
+    async def emit_async(self, event_type: str, detail: Any) -> None:
+        """
+        Emit an event via the Bus and wait for its async handlers.
+
+        See TonikaBus.emit_async(): async handlers run concurrently and
+        are awaited instead of being scheduled fire-and-forget.
+
+        Args:
+            event_type: Event type (e.g., "midi:note-on")
+            detail: Event payload
+        """
+        await self._bus.emit_async(event_type, detail, source=self.name, version=self.version)
+
+    def emit_batch(self, items: Iterable[tuple[str, Any]]) -> None:
+        """
+        Emit several events via the Bus in a single call.
+
+        Cheaper than calling emit() in a loop for bursts; see
+        TonikaBus.emit_batch() for dispatch ordering.
+
+        Args:
+            items: (event_type, detail) pairs
+        """
+        self._bus.emit_batch(items, source=self.name, version=self.version)
+
     def on(self, event_type: str, handler: EventHandler) -> None:
         """
         Subscribe to an event type.
@@ -206,21 +264,20 @@ class TonikaModule:
 
         No memory leaks from orphaned event handlers.
         """
-        # Unsubscribe from all events
-        for unsub in self._unsubs:
-            unsub()
+        # Unsubscribe from all events (one pass per affected event type)
+        self._bus.unsubscribe_many(self._unsubs)
         self._unsubs.clear()
 
         # Emit destruction event BEFORE unregistering
         # so other modules can react to this module going away
-        self.emit("module:destroyed", {"name": self.name, "version": self.version})
+        self.emit(_EV_DESTROYED, {"name": self.name, "version": self.version})
 
         # Remove from registry
         # Goblin Law #13: Keep the Guest List Clean
         self._bus.unregister_module(self.name)
 
         self.status = ModuleStatus.DESTROYED
-        self.logger.info(f"💀 Module destroyed: {self.name}")
+        self.logger.info("💀 Module destroyed: %s", self.name)
 
     def get_status(self) -> dict[str, Any]:
         """
@@ -233,5 +290,5 @@ class TonikaModule:
             "name": self.name,
             "version": self.version,
             "description": self.description,
-            "status": self.status.value,
+            "status": _STATUS_VALUE[self.status],
         }
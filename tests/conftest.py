@@ -22,7 +22,7 @@ def fresh_bus():
     """
     Provide a fresh Bus instance for each test.
 
-    Resets the singleton to ensure test isolation.
+    Resets the singleton's state in place to ensure test isolation.
     Each test gets a clean Bus with no handlers or events.
 
     Usage:
@@ -30,10 +30,9 @@ def fresh_bus():
             fresh_bus.emit("test:event", {})
             assert len(fresh_bus.get_event_log()) == 1
     """
-    # Reset singleton
-    TonikaBus._instance = None
-    TonikaBus._initialized = False
-    bus = TonikaBus()
+    # Reset singleton state (cheaper than rebuilding the Bus every test)
+    bus = TonikaBus.instance()
+    bus.reset_state()
     yield bus
     # Cleanup after test
     bus.clear_event_log()
@@ -16,6 +16,9 @@ These tests verify the Bus enforces proper communication patterns.
 """
 
 import asyncio
+import logging
+import sys
+from enum import StrEnum
 
 import pytest
 
@@ -57,6 +60,39 @@ class TestTonikaBusSingleton:
         # Should be the same object
         assert bus2.handlers is initial_handlers
 
+    def test_instance_returns_singleton(self, fresh_bus):
+        """Test that instance() returns the same object as TonikaBus()"""
+        assert TonikaBus.instance() is fresh_bus
+        assert TonikaBus.instance() is TonikaBus()
+
+    def test_instance_creates_bus_when_missing(self):
+        """Test that instance() constructs the Bus on first use"""
+        TonikaBus._instance = None
+        TonikaBus._initialized = False
+
+        bus = TonikaBus.instance()
+
+        assert isinstance(bus, TonikaBus)
+        assert TonikaBus() is bus
+
+    def test_reset_state_clears_bus_in_place(self, fresh_bus):
+        """Test that reset_state() empties the Bus without replacing the singleton"""
+        calls = []
+        fresh_bus.on("test:event", lambda e: calls.append(e))
+        fresh_bus.once("test:event", lambda e: calls.append(e))
+        fresh_bus.set_debug(True)
+        fresh_bus.set_logging(False)
+        fresh_bus.emit("other:event", {})
+
+        fresh_bus.reset_state()
+        fresh_bus.emit("test:event", {})
+
+        assert TonikaBus.instance() is fresh_bus
+        assert calls == []
+        assert fresh_bus.debug is False
+        assert fresh_bus.logger.level == logging.INFO
+        assert len(fresh_bus.get_event_log()) == 1
+
     def test_singleton_persists_state(self, fresh_bus):
         """Test that state persists across multiple references"""
         fresh_bus.emit("test:event", {"data": 123})
@@ -204,6 +240,42 @@ class TestTonikaBusEmit:
         # Other handlers should still be called
         assert successful_handler_called
 
+    def test_emit_batch_logs_in_input_order(self, fresh_bus):
+        """Test that emit_batch logs every event in input order"""
+        fresh_bus.emit_batch(
+            [("event:a", 1), ("event:b", 2), ("event:a", 3)], source="Batch", version="1.0.0"
+        )
+
+        log = fresh_bus.get_event_log()
+        assert [(e.type, e.detail) for e in log] == [("event:a", 1), ("event:b", 2), ("event:a", 3)]
+        assert all(e._meta.source == "Batch" for e in log)
+        assert [e._meta.seq for e in log] == sorted(e._meta.seq for e in log)
+
+    def test_emit_batch_groups_dispatch_by_type(self, fresh_bus):
+        """Test that emit_batch dispatches grouped by event type"""
+        calls = []
+        fresh_bus.on("event:a", lambda e: calls.append(("a", e.detail)))
+        fresh_bus.on("event:b", lambda e: calls.append(("b", e.detail)))
+
+        fresh_bus.emit_batch([("event:a", 1), ("event:b", 2), ("event:a", 3)])
+
+        assert calls == [("a", 1), ("a", 3), ("b", 2)]
+
+    def test_emit_batch_once_fires_for_first_event(self, fresh_bus):
+        """Test that once() handlers fire only for the first event of their type"""
+        calls = []
+        fresh_bus.once("event:a", lambda e: calls.append(e.detail))
+
+        fresh_bus.emit_batch([("event:a", 1), ("event:a", 2)])
+
+        assert calls == [1]
+
+    def test_emit_batch_empty(self, fresh_bus):
+        """Test that an empty batch is a no-op"""
+        fresh_bus.emit_batch([])
+
+        assert fresh_bus.get_event_log() == []
+
     def test_emit_with_no_handlers(self, fresh_bus):
         """Test that emit works even with no handlers"""
         # Should not raise
@@ -213,6 +285,60 @@ class TestTonikaBusEmit:
         events = fresh_bus.get_event_log()
         assert len(events) == 1
 
+    @pytest.mark.asyncio
+    async def test_emitted_event_types_are_interned(self, fresh_bus):
+        """Test that emit, emit_async and emit_batch intern the event type"""
+        fresh_bus.emit("".join(["runtime:", "built"]), 1)
+        await fresh_bus.emit_async("".join(["runtime:", "built"]), 2)
+        fresh_bus.emit_batch([("".join(["runtime:", "built"]), 3)])
+
+        events = fresh_bus.get_event_log(event_type="runtime:built")
+        assert len(events) == 3
+        assert all(e.type is sys.intern("runtime:built") for e in events)
+
+    @pytest.mark.asyncio
+    async def test_str_subclass_event_types_are_accepted(self, fresh_bus):
+        """Test that StrEnum event types emit normally (they cannot be interned)"""
+
+        class Midi(StrEnum):
+            READY = "midi:ready"
+
+        received = []
+        fresh_bus.on("midi:ready", lambda e: received.append(("on", e.detail)))
+        fresh_bus.once("midi:ready", lambda e: received.append(("once", e.detail)))
+
+        fresh_bus.emit(Midi.READY, 1)
+        await fresh_bus.emit_async(Midi.READY, 2)
+        fresh_bus.emit_batch([(Midi.READY, 3)])
+
+        assert received == [("on", 1), ("once", 1), ("on", 2), ("on", 3)]
+        assert len(fresh_bus.get_event_log(event_type="midi:ready")) == 3
+
+    def test_coroutine_check_not_repeated_per_emit(self, fresh_bus, monkeypatch):
+        """Test that handlers are classified sync/async on subscribe, not on every emit"""
+        import tonika_bus.core.bus as bus_module
+
+        checked = []
+        original_check = bus_module.asyncio.iscoroutinefunction
+
+        def tracking_check(func):
+            checked.append(func)
+            return original_check(func)
+
+        monkeypatch.setattr(bus_module.asyncio, "iscoroutinefunction", tracking_check)
+
+        received = []
+        fresh_bus.on("test:event", received.append)
+        fresh_bus.on("test:event", lambda e: received.append(e.detail))
+        checked.clear()
+
+        for i in range(3):
+            fresh_bus.emit("test:event", i)
+        fresh_bus.emit_batch([("test:event", 3)])
+
+        assert checked == []
+        assert len(received) == 8
+
 
 # ============================================================================
 # Subscription Tests
@@ -261,6 +387,7 @@ class TestTonikaBusSubscription:
 
         fresh_bus.emit("test:event", {})
         assert call_count == 1  # Should not increase
+        assert "test:event" not in fresh_bus.handlers  # Empty entry is pruned
 
     def test_unsubscribe_only_removes_specific_handler(self, fresh_bus):
         """Test that unsubscribe only removes the specific handler"""
@@ -298,6 +425,43 @@ class TestTonikaBusSubscription:
         unsub()
         unsub()
 
+    def test_unsubscribe_many_removes_only_given_subscriptions(self, fresh_bus):
+        """Test that unsubscribe_many() cancels on() and once() subscriptions in bulk"""
+        calls = []
+
+        def keep(event):
+            calls.append("keep")
+
+        unsubs = [
+            fresh_bus.on("test:a", lambda e: calls.append("a")),
+            fresh_bus.on("test:b", lambda e: calls.append("b")),
+            fresh_bus.once("test:a", lambda e: calls.append("once")),
+        ]
+        fresh_bus.on("test:a", keep)
+
+        fresh_bus.unsubscribe_many(unsubs)
+        fresh_bus.emit("test:a", {})
+        fresh_bus.emit("test:b", {})
+
+        assert calls == ["keep"]
+
+    def test_unsubscribe_many_during_dispatch_applies_from_next_emit(self, fresh_bus):
+        """Test that unsubscribe_many() from a handler doesn't cut the current dispatch short"""
+        calls = []
+        unsubs = []
+
+        def first(event):
+            calls.append("first")
+            fresh_bus.unsubscribe_many(unsubs)
+
+        unsubs.append(fresh_bus.on("test:event", first))
+        unsubs.append(fresh_bus.on("test:event", lambda e: calls.append("second")))
+
+        fresh_bus.emit("test:event", {})
+        fresh_bus.emit("test:event", {})
+
+        assert calls == ["first", "second"]
+
     def test_once_only_fires_once(self, fresh_bus):
         """Test that once() only fires handler once"""
         call_count = 0
@@ -339,6 +503,32 @@ class TestTonikaBusSubscription:
 
         assert call_count == 0
 
+    def test_stale_once_unsubscribe_keeps_later_registration(self, fresh_bus):
+        """Test that a fired once()'s unsubscribe does not cancel a later once() of it"""
+        calls = []
+
+        def handler(event):
+            calls.append(event.detail)
+
+        stale = fresh_bus.once("test:event", handler)
+        fresh_bus.emit("test:event", 1)
+
+        fresh_bus.once("test:event", handler)
+        stale()
+        fresh_bus.emit("test:event", 2)
+
+        assert calls == [1, 2]
+
+    def test_once_handlers_run_after_persistent_handlers(self, fresh_bus):
+        """Test that once() handlers fire after on() handlers for the same event"""
+        calls = []
+
+        fresh_bus.once("test:event", lambda e: calls.append("once"))
+        fresh_bus.on("test:event", lambda e: calls.append("on"))
+        fresh_bus.emit("test:event", {})
+
+        assert calls == ["on", "once"]
+
     def test_multiple_subscriptions_to_same_event(self, fresh_bus):
         """Test multiple handlers for the same event type"""
         calls = []
@@ -396,6 +586,20 @@ class TestTonikaBusAsync:
         with pytest.raises(asyncio.TimeoutError):
             await fresh_bus.wait_for("nonexistent:event", timeout_ms=100)
 
+    @pytest.mark.asyncio
+    async def test_wait_for_timeout_drops_waiter(self, fresh_bus):
+        """Test that timed-out and cancelled waiters are removed from the Bus"""
+        with pytest.raises(asyncio.TimeoutError):
+            await fresh_bus.wait_for("nonexistent:event", timeout_ms=10)
+
+        task = asyncio.create_task(fresh_bus.wait_for("nonexistent:event"))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert "nonexistent:event" not in fresh_bus._wait_promises
+
     @pytest.mark.asyncio
     async def test_wait_for_without_timeout(self, fresh_bus):
         """Test wait_for without timeout"""
@@ -436,6 +640,37 @@ class TestTonikaBusAsync:
         assert len(results) == 3
         assert all(detail == {"data": "shared"} for _, detail in results)
 
+    @pytest.mark.asyncio
+    async def test_wait_for_resumes_after_emit_returns(self, fresh_bus):
+        """Test that waiters resume only after emit() has dispatched every handler"""
+        order = []
+
+        async def waiter():
+            await fresh_bus.wait_for("test:event", timeout_ms=1000)
+            order.append("waiter")
+
+        task = asyncio.create_task(waiter())
+        await asyncio.sleep(0.01)
+
+        fresh_bus.on("test:event", lambda e: order.append("handler"))
+        fresh_bus.emit("test:event", {})
+        order.append("emit returned")
+
+        await task
+
+        assert order == ["handler", "emit returned", "waiter"]
+
+    @pytest.mark.asyncio
+    async def test_emit_batch_resolves_waiters(self, fresh_bus):
+        """Test that emit_batch resolves wait_for() with the first event of the type"""
+        task = asyncio.create_task(fresh_bus.wait_for("event:a", timeout_ms=1000))
+        await asyncio.sleep(0.01)
+
+        fresh_bus.emit_batch([("event:a", 1), ("event:a", 2)])
+
+        event = await task
+        assert event.detail == 1
+
     @pytest.mark.asyncio
     async def test_emit_async_handler_with_running_loop(self, fresh_bus):
         """Async handler should be scheduled when loop is running (create_task path)."""
@@ -452,6 +687,142 @@ class TestTonikaBusAsync:
 
         assert results == [{"x": 1}]
 
+    @pytest.mark.asyncio
+    async def test_emit_async_awaits_async_handlers_concurrently(self, fresh_bus):
+        """emit_async() should run sync handlers inline and await async ones together."""
+        calls = []
+        started = asyncio.Event()
+
+        async def slow(event: TonikaEvent):
+            calls.append("slow:start")
+            await started.wait()
+            calls.append("slow:end")
+
+        async def fast(event: TonikaEvent):
+            calls.append("fast")
+            started.set()
+
+        async def failing(event: TonikaEvent):
+            raise ValueError("boom")
+
+        fresh_bus.on("async:event", slow)
+        fresh_bus.on("async:event", lambda e: calls.append("sync"))
+        fresh_bus.on("async:event", failing)
+        fresh_bus.once("async:event", fast)
+
+        await asyncio.wait_for(fresh_bus.emit_async("async:event", {}), timeout=1)
+
+        assert calls == ["sync", "slow:start", "fast", "slow:end"]
+        assert not fresh_bus._tasks
+        assert len(fresh_bus.get_event_log()) == 1
+
+    @pytest.mark.asyncio
+    async def test_emit_async_resolves_waiters(self, bus_with_debug):
+        """emit_async() should resolve wait_for() like emit() does."""
+        task = asyncio.create_task(bus_with_debug.wait_for("async:event", timeout_ms=1000))
+        await asyncio.sleep(0)
+
+        await bus_with_debug.emit_async("async:event", {"x": 1})
+
+        assert (await task).detail == {"x": 1}
+
+    @pytest.mark.asyncio
+    async def test_drain_waits_for_async_handlers(self, fresh_bus):
+        """drain() should return only after async handlers, and those they trigger, finish."""
+        results = []
+
+        async def first(event: TonikaEvent):
+            await asyncio.sleep(0.01)
+            results.append("first")
+            fresh_bus.emit("async:second", None)
+
+        async def second(event: TonikaEvent):
+            await asyncio.sleep(0.01)
+            results.append("second")
+
+        fresh_bus.on("async:first", first)
+        fresh_bus.on("async:second", second)
+        fresh_bus.emit("async:first", None)
+
+        await fresh_bus.drain()
+
+        assert results == ["first", "second"]
+        assert not fresh_bus._tasks
+
+    @pytest.mark.asyncio
+    async def test_drain_from_async_handler(self, fresh_bus):
+        """drain() inside an async handler should wait for the others, not itself."""
+        results = []
+
+        async def slow(event: TonikaEvent):
+            await asyncio.sleep(0.01)
+            results.append("slow")
+
+        async def draining(event: TonikaEvent):
+            await fresh_bus.drain()
+            results.append("draining")
+
+        fresh_bus.on("async:event", slow)
+        fresh_bus.on("async:event", draining)
+        fresh_bus.emit("async:event", None)
+
+        await asyncio.wait_for(fresh_bus.drain(), timeout=1)
+
+        assert results == ["slow", "draining"]
+
+    @pytest.mark.asyncio
+    async def test_drain_from_several_async_handlers(self, fresh_bus):
+        """Handlers that drain() concurrently should not wait on each other."""
+        results = []
+
+        async def slow(event: TonikaEvent):
+            await asyncio.sleep(0.01)
+            results.append("slow")
+
+        async def first(event: TonikaEvent):
+            await fresh_bus.drain()
+            results.append("first")
+
+        async def second(event: TonikaEvent):
+            await fresh_bus.drain()
+            results.append("second")
+
+        fresh_bus.on("async:event", slow)
+        fresh_bus.on("async:event", first)
+        fresh_bus.on("async:event", second)
+        fresh_bus.emit("async:event", None)
+
+        await asyncio.wait_for(fresh_bus.drain(), timeout=1)
+
+        assert results[0] == "slow"
+        assert sorted(results[1:]) == ["first", "second"]
+        assert not fresh_bus._tasks
+
+    @pytest.mark.asyncio
+    async def test_reset_state_cancels_running_handlers(self, fresh_bus):
+        """reset_state() should cancel async handlers still in flight."""
+        finished = []
+
+        async def slow(event: TonikaEvent):
+            await asyncio.sleep(1)
+            finished.append(event)
+
+        fresh_bus.on("async:event", slow)
+        fresh_bus.emit("async:event", None)
+        (task,) = fresh_bus._tasks
+
+        fresh_bus.reset_state()
+        await asyncio.sleep(0)
+
+        assert task.cancelled()
+        assert finished == []
+        assert not fresh_bus._tasks
+
+    @pytest.mark.asyncio
+    async def test_drain_returns_when_idle(self, fresh_bus):
+        """drain() with nothing scheduled should return immediately."""
+        await asyncio.wait_for(fresh_bus.drain(), timeout=0.1)
+
     def test_emit_async_handler_without_running_loop(self, fresh_bus):
         """Async handler should run via asyncio.run when no loop is running."""
         results = []
@@ -539,6 +910,19 @@ class TestTonikaBusEventLog:
         assert log[0].type == "event:15"
         assert log[4].type == "event:19"
 
+    def test_event_log_filter_by_type(self, fresh_bus):
+        """Test that get_event_log can filter by event type, with and without limit"""
+        for i in range(6):
+            fresh_bus.emit("event:even" if i % 2 == 0 else "event:odd", {"index": i})
+
+        evens = fresh_bus.get_event_log(event_type="event:even")
+        assert [e.detail["index"] for e in evens] == [0, 2, 4]
+
+        recent_odds = fresh_bus.get_event_log(limit=2, event_type="event:odd")
+        assert [e.detail["index"] for e in recent_odds] == [3, 5]
+
+        assert fresh_bus.get_event_log(event_type="event:none") == []
+
     def test_event_log_bounded_size(self, fresh_bus):
         """Test that event log doesn't grow unbounded"""
         max_len = fresh_bus._event_log_maxlen
@@ -555,6 +939,23 @@ class TestTonikaBusEventLog:
         # Should contain the MOST RECENT events
         assert log[-1].type == f"event:{max_len + 99}"
 
+    def test_set_event_log_cap_keeps_most_recent(self, fresh_bus):
+        """Test that shrinking the log cap keeps the newest events and bounds future ones"""
+        for i in range(10):
+            fresh_bus.emit(f"event:{i}", {})
+
+        fresh_bus.set_event_log_cap(3)
+        assert [e.type for e in fresh_bus.get_event_log()] == ["event:7", "event:8", "event:9"]
+
+        fresh_bus.emit("event:10", {})
+        assert [e.type for e in fresh_bus.get_event_log()] == ["event:8", "event:9", "event:10"]
+
+        with pytest.raises(ValueError):
+            fresh_bus.set_event_log_cap(0)
+
+        fresh_bus.reset_state()
+        assert fresh_bus.event_log.maxlen == TonikaBus.DEFAULT_EVENT_LOG_CAP
+
     def test_clear_event_log(self, fresh_bus):
         """Test that clear_event_log empties the log"""
         fresh_bus.emit("event:1", {})
@@ -565,6 +966,95 @@ class TestTonikaBusEventLog:
         log = fresh_bus.get_event_log()
         assert len(log) == 0
 
+    def test_set_logging_disables_event_log(self, fresh_bus):
+        """Test that events are not recorded while logging is disabled"""
+        fresh_bus.emit("event:1", {})
+
+        fresh_bus.set_logging(False)
+        fresh_bus.emit("event:2", {})
+
+        log = fresh_bus.get_event_log()
+        assert [e.type for e in log] == ["event:1"]
+
+    def test_set_logging_still_dispatches(self, fresh_bus):
+        """Test that handlers still fire while logging is disabled"""
+        received = []
+        fresh_bus.on("test:event", received.append)
+
+        fresh_bus.set_logging(False)
+        fresh_bus.emit("test:event", {"data": 1})
+
+        assert len(received) == 1
+        assert fresh_bus.get_event_log() == []
+
+    def test_set_logging_can_be_reenabled(self, fresh_bus):
+        """Test that logging resumes after being re-enabled"""
+        fresh_bus.set_logging(False)
+        fresh_bus.emit("event:1", {})
+        fresh_bus.set_logging(True)
+        fresh_bus.emit("event:2", {})
+
+        log = fresh_bus.get_event_log()
+        assert [e.type for e in log] == ["event:2"]
+
+    def test_set_logging_skips_unhandled_events(self, fresh_bus):
+        """Test that unhandled=False logs only events somebody listens for"""
+        fresh_bus.on("heard:event", lambda e: None)
+        fresh_bus.set_logging(True, unhandled=False)
+
+        fresh_bus.emit("heard:event", {})
+        fresh_bus.emit("unheard:event", {})
+        fresh_bus.emit_batch([("unheard:event", 1), ("heard:event", 2)])
+
+        log = fresh_bus.get_event_log()
+        assert [e.type for e in log] == ["heard:event", "heard:event"]
+
+    def test_unheard_event_not_built_when_logging_disabled(self, fresh_bus, monkeypatch):
+        """Test that emit skips event construction when nothing can observe it"""
+        import tonika_bus.core.bus as bus_module
+
+        created = []
+        original_create = bus_module.EventMetadata.create
+
+        def tracking_create(source, version):
+            created.append(source)
+            return original_create(source, version)
+
+        monkeypatch.setattr(bus_module.EventMetadata, "create", staticmethod(tracking_create))
+
+        fresh_bus.set_logging(False)
+        fresh_bus.emit("nobody:listens", {})
+        assert created == []
+
+        fresh_bus.on("somebody:listens", lambda e: None)
+        fresh_bus.emit("somebody:listens", {})
+        assert len(created) == 1
+
+    def test_unheard_batch_not_built_when_logging_disabled(self, fresh_bus, monkeypatch):
+        """Test that emit_batch skips event construction when nothing can observe it"""
+        import tonika_bus.core.bus as bus_module
+
+        created = []
+        original_create_many = bus_module.EventMetadata.create_many
+
+        def tracking_create_many(source, version, count):
+            created.append(count)
+            return original_create_many(source, version, count)
+
+        monkeypatch.setattr(
+            bus_module.EventMetadata, "create_many", staticmethod(tracking_create_many)
+        )
+
+        fresh_bus.set_logging(False)
+        fresh_bus.emit_batch([("nobody:listens", 1), ("nobody:listens", 2)])
+        assert created == []
+
+        received = []
+        fresh_bus.on("somebody:listens", received.append)
+        fresh_bus.emit_batch([("nobody:listens", 1), ("somebody:listens", 2)])
+        assert created == [2]
+        assert [e.detail for e in received] == [2]
+
     def test_get_event_log_returns_copy(self, fresh_bus):
         """Test that get_event_log returns a copy, not the internal deque"""
         fresh_bus.emit("event:1", {})
@@ -709,6 +1199,8 @@ class TestTonikaBusDebug:
             unsub = fresh_bus.on("dbg:event", handler)
             fresh_bus.emit("dbg:event", {})
             unsub()
+            fresh_bus.once("dbg:event", handler)()
+            fresh_bus.emit_batch([("dbg:event", {})])
             fresh_bus.clear_event_log()
 
         # No assertion needed; coverage of debug branches is the goal
@@ -762,6 +1254,61 @@ class TestTonikaBusEdgeCases:
         # Should only be called once
         assert call_count == 1
 
+    def test_subscribe_during_handler_execution(self, fresh_bus):
+        """Test that a handler subscribed mid-dispatch only fires on the next emit"""
+        calls = []
+
+        def late_handler(event):
+            calls.append("late")
+
+        def handler(event):
+            calls.append("handler")
+            fresh_bus.on("test:event", late_handler)
+
+        fresh_bus.on("test:event", handler)
+
+        fresh_bus.emit("test:event", {})
+        assert calls == ["handler"]
+
+        fresh_bus.emit("test:event", {})
+        assert calls == ["handler", "handler", "late"]
+
+    def test_reentrant_emit_sees_subscription_changes(self, fresh_bus):
+        """Test that a re-entrant emit uses the handlers current at that moment"""
+        calls = []
+        unsubs = {}
+
+        def first(event):
+            calls.append(("first", event.detail))
+            if event.detail == "outer":
+                unsubs["second"]()
+                fresh_bus.emit("test:event", "inner")
+
+        def second(event):
+            calls.append(("second", event.detail))
+
+        fresh_bus.on("test:event", first)
+        unsubs["second"] = fresh_bus.on("test:event", second)
+
+        fresh_bus.emit("test:event", "outer")
+
+        # The outer dispatch finishes over its snapshot; the inner one no longer sees `second`
+        assert calls == [("first", "outer"), ("first", "inner"), ("second", "outer")]
+
+    def test_once_not_refired_by_reentrant_emit(self, fresh_bus):
+        """Test that once() handlers fire once even if the event is re-emitted mid-dispatch"""
+        call_count = 0
+
+        def handler(event):
+            nonlocal call_count
+            call_count += 1
+            fresh_bus.emit("test:event", {})
+
+        fresh_bus.once("test:event", handler)
+        fresh_bus.emit("test:event", {})
+
+        assert call_count == 1
+
     def test_empty_event_type(self, fresh_bus):
         """Test emitting event with empty string type"""
         fresh_bus.emit("", {"data": 123})
@@ -107,6 +107,29 @@ class TestEventMetadata:
         # Timestamps should be different (or at least not guaranteed to be same)
         assert meta1.timestamp <= meta2.timestamp
 
+    def test_sequence_is_strictly_increasing(self):
+        """Test that create() assigns strictly increasing sequence numbers"""
+        metas = [EventMetadata.create(source="Test", version="1.0.0") for _ in range(5)]
+
+        for earlier, later in zip(metas, metas[1:], strict=False):
+            assert earlier.seq < later.seq
+
+    def test_create_many_shares_timestamp_with_ordered_seq(self):
+        """Test that create_many() stamps one timestamp and increasing sequence numbers"""
+        metas = EventMetadata.create_many(source="Test", version="1.0.0", count=4)
+
+        assert len(metas) == 4
+        assert len({meta.timestamp for meta in metas}) == 1
+        assert all(meta.source == "Test" and meta.version == "1.0.0" for meta in metas)
+        for earlier, later in zip(metas, metas[1:], strict=False):
+            assert earlier.seq < later.seq
+
+    def test_sequence_defaults_for_direct_construction(self):
+        """Test that hand-built metadata gets the default sequence number"""
+        meta = EventMetadata(timestamp=0, source="Test", version="1.0.0")
+
+        assert meta.seq == 0
+
     def test_metadata_direct_construction(self):
         """Test creating metadata directly (not via factory)"""
         timestamp = int(datetime.now().timestamp() * 1000)
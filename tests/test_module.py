@@ -14,6 +14,8 @@ These tests verify standardized module lifecycle management.
 
 import asyncio
 import contextlib
+import logging
+from enum import StrEnum
 
 import pytest
 
@@ -181,6 +183,7 @@ class TestTonikaModuleLifecycle:
 
         # No new events should be received
         assert len(module.received_events) == 0
+        assert "test:event" not in fresh_bus.handlers
 
 
 # ============================================================================
@@ -214,20 +217,44 @@ class TestTonikaModuleEventHandling:
         await module.init()
 
         # Check event log
-        events = fresh_bus.get_event_log()
-        init_events = [e for e in events if e.type == "module:initialized"]
+        init_events = fresh_bus.get_event_log(event_type="module:initialized")
 
         assert len(init_events) == 1
         assert init_events[0].detail["module"] == "EventEmitter"
 
+    @pytest.mark.asyncio
+    async def test_module_can_emit_batch(self, fresh_bus):
+        """Test that module can emit a batch of events with its source"""
+        module = SimpleModule()
+        module.emit_batch([("batch:a", 1), ("batch:b", 2)])
+
+        events = [e for e in fresh_bus.get_event_log() if e.type.startswith("batch:")]
+
+        assert [e.detail for e in events] == [1, 2]
+        assert all(e._meta.source == "SimpleModule" for e in events)
+
+    @pytest.mark.asyncio
+    async def test_module_can_emit_async(self, fresh_bus):
+        """Test that module emit_async awaits async handlers before returning"""
+        module = SimpleModule()
+        received = []
+
+        async def handler(event):
+            await asyncio.sleep(0)
+            received.append(event._meta.source)
+
+        fresh_bus.on("async:event", handler)
+        await module.emit_async("async:event", {})
+
+        assert received == ["SimpleModule"]
+
     @pytest.mark.asyncio
     async def test_module_events_have_correct_source(self, fresh_bus):
         """Test that module-emitted events have correct source"""
         module = EventEmittingModule()
         await module.init()
 
-        events = fresh_bus.get_event_log()
-        init_event = [e for e in events if e.type == "module:initialized"][0]
+        init_event = fresh_bus.get_event_log(event_type="module:initialized")[0]
 
         assert init_event._meta.source == "EventEmitter"
         assert init_event._meta.version == "1.0.0"
@@ -249,6 +276,23 @@ class TestTonikaModuleEventHandling:
         fresh_bus.emit("test:event", {"data": 2})
         assert len(module.received_events) == 1  # Still 1, not 2
 
+    def test_module_destroy_keeps_other_modules_once_handlers(self, fresh_bus):
+        """Test that destroy() only cancels the module's own once() registrations"""
+        received = []
+
+        def shared(event):
+            received.append(event.detail)
+
+        module_a = SimpleModule("ModuleA")
+        module_b = SimpleModule("ModuleB")
+        module_a.once("midi:ready", shared)
+        module_b.once("midi:ready", shared)
+
+        module_a.destroy()
+        fresh_bus.emit("midi:ready", "x")
+
+        assert received == ["x"]
+
     @pytest.mark.asyncio
     async def test_module_multiple_subscriptions(self, fresh_bus):
         """Test module with multiple event subscriptions"""
@@ -260,8 +304,14 @@ class TestTonikaModuleEventHandling:
                 self.event_b_count = 0
 
             async def _initialize(self):
-                self.on("event:a", lambda e: setattr(self, "event_a_count", self.event_a_count + 1))
-                self.on("event:b", lambda e: setattr(self, "event_b_count", self.event_b_count + 1))
+                self.on("event:a", self._count_a)
+                self.on("event:b", self._count_b)
+
+            def _count_a(self, event):
+                self.event_a_count += 1
+
+            def _count_b(self, event):
+                self.event_b_count += 1
 
         module = MultiSubscriber()
         await module.init()
@@ -284,7 +334,10 @@ class TestTonikaModuleEventHandling:
                 self.call_count = 0
 
             async def _initialize(self):
-                self.once("test:event", lambda e: setattr(self, "call_count", self.call_count + 1))
+                self.once("test:event", self._count)
+
+            def _count(self, event):
+                self.call_count += 1
 
         module = OnceSubscriber()
         await module.init()
@@ -443,13 +496,25 @@ class TestTonikaModuleProperties:
         assert module.name == "TestModule"
         assert module.version == "1.0.0"
 
+    def test_module_accepts_str_subclass_name(self):
+        """Test that StrEnum names and versions work (they cannot be interned)"""
+
+        class Names(StrEnum):
+            CLOCK = "Clock"
+            V1 = "1.0.0"
+
+        module = TonikaModule(name=Names.CLOCK, version=Names.V1)
+
+        assert module.name == "Clock"
+        assert module.version == "1.0.0"
+
     def test_module_bus_reference(self, fresh_bus):
         """Test that module has reference to bus (private _bus)"""
         module = SimpleModule()
 
         # Note: bus is private (_bus), not public
         assert module._bus is fresh_bus
-        assert module._bus is TonikaBus()
+        assert module._bus is TonikaBus.instance()
 
     def test_module_subscriptions_tracking(self):
         """Test that module tracks its unsubscribe functions"""
@@ -459,6 +524,16 @@ class TestTonikaModuleProperties:
         assert hasattr(module, "_unsubs")
         assert isinstance(module._unsubs, list)
 
+    def test_module_logger_tags_shared_logger(self, caplog):
+        """Test that modules log through the shared TonikaModule logger, tagged by name"""
+        module = SimpleModule(name="Tagged")
+
+        with caplog.at_level(logging.INFO, logger="TonikaModule"):
+            module.logger.info("hello")
+
+        assert module.logger.logger is logging.getLogger("TonikaModule")
+        assert caplog.records[-1].tonika_module == "Tagged"
+
 
 # ============================================================================
 # Integration Tests
@@ -578,14 +653,12 @@ class TestTonikaModuleIntegration:
         await module.init()
 
         # Check for init event
-        events = fresh_bus.get_event_log()
-        init_events = [e for e in events if e.type == "module:initialized"]
+        init_events = fresh_bus.get_event_log(event_type="module:initialized")
         assert len(init_events) == 1
 
         # Destroy
         module.destroy()
 
         # Check for destroy event
-        events = fresh_bus.get_event_log()
-        destroy_events = [e for e in events if e.type == "module:destroyed"]
+        destroy_events = fresh_bus.get_event_log(event_type="module:destroyed")
         assert len(destroy_events) == 1